@@ -1,14 +1,82 @@
 import asyncio
-import pandas as pd
-from playwright.async_api import async_playwright
+import csv
+import httpx
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
 from datetime import datetime
 import random
+import time
 
 # --- CONFIGURATION ---
 TARGET_URL = "https://www.ycombinator.com/companies"
 TARGET_COUNT = 500          # Goal: Scrape 500 unique startups
-CONCURRENCY_LIMIT = 3       # Max number of browser tabs open at once (prevents rate-limiting)
-BATCH_SIZE = 50             # Save progress to CSV after every 50 companies
+CONCURRENCY_LIMIT = 3       # Max number of browser tabs open at once per context (prevents rate-limiting)
+CONTEXT_COUNT = 4           # Browser contexts sharing the page pool; each is a full Chromium process (~200-300 MB RAM)
+BROWSER_CACHE_DIR = "./.pw-cache"  # Persistent Chromium profiles (HTTP + JS code cache), one per context
+HTTP_MAX_CONNECTIONS = 32   # Max concurrent static (no-browser) fetches / open HTTP/2 connections
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+RATE_LIMIT = 8              # Max requests per second to ycombinator.com (lowered automatically when throttled)
+RATE_RECOVERY_STREAK = 20   # Successful responses needed before the rate is raised again
+THROTTLE_COOLDOWN = 5       # Seconds after a rate cut during which further throttle signals are ignored
+MAX_ATTEMPTS = 4            # Tries per profile before it is recorded as an error
+NAV_TIMEOUT = 15            # Seconds a single profile page load may take
+PROFILE_TIMEOUT = 35        # Budget (seconds) of request/page work per company, excluding our own pacing waits.
+                            # Allows ~2 navigation timeouts (NAV_TIMEOUT); later attempts only follow fast failures
+BATCH_SIZE = 50             # Save progress to CSV after every 50 completed companies
+PROGRESS_FILE = "yc_scraping_progress.csv"  # Interim CSV, appended to after every batch and resumed from on restart
+
+# Column order of the exported CSV files ('URL' also keys the resume checkpoint)
+CSV_FIELDS = ["Company Name", "Batch", "Short Description", "Founder Name(s)", "Founder LinkedIn URL(s)", "URL"]
+CSV_SCHEMA = pa.schema([(field, pa.string()) for field in CSV_FIELDS])
+
+# Responses that mean the server wants us to slow down
+THROTTLE_STATUSES = {429, 503}
+
+# UI labels that share the founder-name styling and must not be reported as names
+NAME_BLACKLIST = frozenset(("Founders", "Jobs", "Blog", "Team", "Company", "Launch", "News"))
+
+# Anchors on the directory page that point to company profiles
+COMPANY_LINK_SEL = 'a[href^="/companies/"]'
+
+# Heavy assets that are never needed for data extraction (blocked by file extension,
+# with or without a query string, e.g. "logo.png" and "logo.png?v=2")
+BLOCKED_ASSET_EXTENSIONS = ("png", "jpg", "jpeg", "webp", "svg", "gif", "woff", "woff2", "css", "ico", "mp4")
+BLOCKED_URL_PATTERNS = [pattern for ext in BLOCKED_ASSET_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+# Profile page selectors, shared by the static HTML parser and the in-browser scripts
+NAME_SEL = "h1"
+BATCH_SEL = "a[href*='batch=']"
+DESC_SEL = "p.whitespace-pre-line, div.text-xl"
+LINKEDIN_SEL = 'a[href*="linkedin.com/in/"]'
+FOUNDER_NAME_SELS = ("div.font-bold", "h3")
+PROFILE_SELECTORS = {
+    "name": NAME_SEL,
+    "batch": BATCH_SEL,
+    "desc": DESC_SEL,
+    "links": LINKEDIN_SEL,
+    "names": list(FOUNDER_NAME_SELS),
+}
+
+# Resolves as soon as the profile has hydrated, with or without founder LinkedIn links
+PROFILE_READY_JS = """(sel) => document.querySelector(sel.name) && (
+    document.querySelectorAll(sel.links).length > 0 ||
+    document.querySelectorAll(sel.names[0]).length > 2
+)"""
+
+# Collects all profile fields in one page.evaluate call (one browser round-trip per company)
+PROFILE_EXTRACT_JS = """(sel) => {
+    const q = (s) => document.querySelector(s);
+    const qa = (s) => [...document.querySelectorAll(s)];
+    return {
+        name: q(sel.name)?.innerText ?? null,
+        batch: q(sel.batch)?.innerText ?? null,
+        desc: q(sel.desc)?.innerText ?? null,
+        links: qa(sel.links).map(a => a.getAttribute('href')),
+        names: sel.names.flatMap(qa).map(e => e.innerText.trim()),
+    };
+}"""
 
 async def scroll_and_extract_links(page, target_count):
     """
@@ -17,155 +85,439 @@ async def scroll_and_extract_links(page, target_count):
     print(f"[*] Navigating to {TARGET_URL}...")
     await page.goto(TARGET_URL, timeout=60000)
     
-    company_links = set()
+    company_links = {} # dict keeps discovery order, so reruns select the same companies
+    last_seen = 0 # Number of company anchors already read from the DOM
     scroll_attempts = 0
     
     # Continue scrolling until we reach the target count or a safety limit
     while len(company_links) < target_count and scroll_attempts < 150:
-        # Locate all links that point to company profiles
-        links = await page.locator('a[href^="/companies/"]').all()
-        for link in links:
-            href = await link.get_attribute('href')
-            if href and "/companies/" in href:
-                full_url = f"https://www.ycombinator.com{href}"
-                company_links.add(full_url)
+        # OPTIMIZATION: Read only the anchors added since the last scroll, in a single
+        # browser round-trip, so already-seen hrefs are never sent back to Python again
+        hrefs = await page.eval_on_selector_all(
+            COMPANY_LINK_SEL, "(els, start) => els.slice(start).map(e => e.getAttribute('href'))", last_seen
+        )
+        last_seen += len(hrefs)
+        company_links.update(dict.fromkeys(f"https://www.ycombinator.com{href}" for href in hrefs if href))
         
         if len(company_links) >= target_count:
             break
 
         # Execute JavaScript to scroll to the bottom of the page to trigger lazy-loading
         await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await page.wait_for_timeout(2000) # Wait for new companies to load
+        # Wait only until new companies are rendered instead of a fixed 2s sleep
+        try:
+            await page.wait_for_function(
+                "([sel, prev]) => document.querySelectorAll(sel).length > prev",
+                arg=[COMPANY_LINK_SEL, last_seen],
+                timeout=3000,
+            )
+        except PlaywrightTimeoutError:
+            pass # Nothing new loaded (e.g. end of the list); try scrolling again
         scroll_attempts += 1
     
     print(f"[*] Collected {len(company_links)} company URLs.")
     return list(company_links)[:target_count]
 
-async def scrape_company_details(context, url, semaphore):
+class ThrottledError(Exception):
+    """
+    The server asked us to slow down (HTTP 429/503) or stopped responding in time.
+    """
+
+class AdaptiveRateLimiter:
+    """
+    Paces requests to one host, one at a time at 1/rate second intervals, and adapts to the
+    server's responses: a throttle signal (HTTP 429/503, timeouts) cuts the rate by 20% (at most
+    once per THROTTLE_COOLDOWN, so a burst of concurrent failures counts as one), and a streak of
+    successful responses raises it again, up to the configured starting rate.
+    """
+
+    def __init__(self, rate, min_rate=1.0):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self._last_request = float("-inf") # time.monotonic() of the last granted request
+        self._last_cut = float("-inf")
+        self._success_streak = 0
+
+    async def acquire(self):
+        # Waiters re-check after sleeping, so only one is let through per interval and a
+        # rate change applies immediately to everyone still waiting
+        while True:
+            now = time.monotonic()
+            ready_at = self._last_request + 1.0 / self.rate
+            if now >= ready_at:
+                self._last_request = now
+                return
+            await asyncio.sleep(ready_at - now)
+
+    def throttled(self):
+        now = time.monotonic()
+        if now - self._last_cut < THROTTLE_COOLDOWN:
+            return # Already slowed down for this burst of failures
+        self._last_cut = now
+        self.rate = max(self.min_rate, self.rate * 0.8)
+        self._success_streak = 0
+
+    def succeeded(self):
+        self._success_streak += 1
+        if self._success_streak >= RATE_RECOVERY_STREAK and self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate * 1.2)
+            self._success_streak = 0
+
+def build_company_record(data, url):
+    """
+    Cleans the raw profile fields (from the browser or static HTML) into one CSV row.
+    """
+    # --- 1. Basic Data Extraction ---
+    name = data["name"]
+    
+    # Extract the YC Batch (e.g., W24, S22) via href pattern
+    batch = data["batch"] or "N/A"
+
+    # Extract the short company description
+    desc = data["desc"] or "N/A"
+
+    # --- 2. Founder & LinkedIn Enrichment ---
+    # Sets give O(1) duplicate checks while the lists keep page order
+    founder_names, seen_names = [], set()
+    founder_links, seen_links = [], set()
+
+    # Find all unique LinkedIn URLs on the profile page
+    for link in data["links"]:
+        if link:
+            # CLEANUP: Remove tracking parameters (?miniProfile...) and trailing slashes
+            clean_link = link.split('?', 1)[0].rstrip('/')
+            if clean_link not in seen_links:
+                seen_links.add(clean_link)
+                founder_links.append(clean_link)
+
+    # HEURISTIC NAME DISCOVERY: Bolded text/headers in the founder section
+    for text in data["names"]:
+        words = text.split()
+        # FILTER: Real names are usually 1-3 words. Ignore UI buttons/headers.
+        if 0 < len(words) <= 3 and NAME_BLACKLIST.isdisjoint(words):
+            if text not in seen_names:
+                seen_names.add(text)
+                founder_names.append(text)
+
+    # Return dictionary for easy CSV export
+    return {
+        "Company Name": name.strip(),
+        "Batch": batch.strip(),
+        "Short Description": desc.strip(),
+        "Founder Name(s)": ", ".join(founder_names),
+        "Founder LinkedIn URL(s)": ", ".join(founder_links),
+        "URL": url
+    }
+
+async def fetch_static_profile(client, limiter, budget, url):
+    """
+    FAST PATH: Downloads the server-rendered HTML and parses it without a browser.
+    Returns None when the page needs JavaScript hydration to expose the founder data,
+    and raises ThrottledError when the server asks us to slow down.
+    """
+    try:
+        await paused(budget, limiter.acquire())
+        response = await client.get(url)
+    except httpx.TimeoutException as e:
+        limiter.throttled() # Slow responses usually mean the host is overloaded
+        raise ThrottledError(f"Static fetch timed out: {e}") from e
+    except httpx.HTTPError:
+        return None
+    if response.status_code in THROTTLE_STATUSES:
+        limiter.throttled()
+        raise ThrottledError(f"Throttled with HTTP {response.status_code}")
+    if not response.is_success:
+        return None # Any other non-2xx response falls back to the browser
+    limiter.succeeded()
+
+    tree = HTMLParser(response.text)
+
+    def text_of(node):
+        return node.text().strip() if node is not None else None
+
+    name = text_of(tree.css_first(NAME_SEL))
+    if not name:
+        return None
+
+    record = build_company_record({
+        "name": name,
+        "batch": text_of(tree.css_first(BATCH_SEL)),
+        "desc": text_of(tree.css_first(DESC_SEL)),
+        "links": [a.attributes.get("href") for a in tree.css(LINKEDIN_SEL)],
+        "names": [text_of(el) for sel in FOUNDER_NAME_SELS for el in tree.css(sel)],
+    }, url)
+    # No founders AND no LinkedIn means the founder section is rendered client-side
+    if not record["Founder Name(s)"] and not record["Founder LinkedIn URL(s)"]:
+        return None
+    return record
+
+async def scrape_company_details(page_queue, client, http_slots, limiter, url):
     """
     Visits an individual company profile to extract deep-level data.
+    Tries the static HTML first (bounded by 'http_slots') and only borrows a reusable
+    browser page from 'page_queue' when the profile needs JavaScript.
+    The PROFILE_TIMEOUT budget only counts time spent on requests and page work: waiting for a
+    fetch slot, a page, a rate-limit token or a backoff sleep is our own pacing and is excluded.
     """
-    async with semaphore: # Ensure only 'CONCURRENCY_LIMIT' tasks run at once
-        for attempt in range(2): # Simple retry logic for network stability
-            page = await context.new_page()
+    try:
+        # WALL-CLOCK BUDGET: Covers the static fetch and every browser attempt of this company
+        async with asyncio.timeout(PROFILE_TIMEOUT) as budget:
+            first_attempt = 0
+            await paused(budget, http_slots.acquire()) # Waits until one of the 'HTTP_MAX_CONNECTIONS' slots is free
             try:
-                # OPTIMIZATION: Block heavy assets like images/CSS to save bandwidth and speed up loading
-                await page.route("**/*", lambda route: route.abort() 
-                                 if route.request.resource_type in ["image", "font", "stylesheet"] 
-                                 else route.continue_())
-                
-                # Human-like behavior: Random delay before navigating
-                await asyncio.sleep(random.uniform(1, 2))
-                await page.goto(url, timeout=40000, wait_until="domcontentloaded")
-                
-                # SMART DISCOVERY: Wait for LinkedIn links to "hydrate" (render via JS) 
-                try:
-                    await page.wait_for_selector('a[href*="linkedin.com/in/"]', timeout=3000)
-                except:
-                    pass # Continue even if no LinkedIn is found
-
-                # --- 1. Basic Data Extraction ---
-                name = await page.locator("h1").first.inner_text()
-                
-                # Extract the YC Batch (e.g., W24, S22) via href pattern
-                batch = "N/A"
-                batch_loc = page.locator("a[href*='batch=']").first
-                if await batch_loc.is_visible():
-                    batch = await batch_loc.inner_text()
-
-                # Extract the short company description
-                desc = "N/A"
-                desc_loc = page.locator("p.whitespace-pre-line, div.text-xl").first
-                if await desc_loc.is_visible():
-                    desc = await desc_loc.inner_text()
-
-                # --- 2. Founder & LinkedIn Enrichment ---
-                founder_names = []
-                founder_links = []
-
-                # Find all unique LinkedIn URLs on the profile page
-                li_elements = await page.locator('a[href*="linkedin.com/in/"]').all()
-                for li in li_elements:
-                    link = await li.get_attribute("href")
-                    if link:
-                        # CLEANUP: Remove tracking parameters (?miniProfile...) and trailing slashes
-                        clean_link = link.split('?')[0].rstrip('/')
-                        if clean_link not in founder_links:
-                            founder_links.append(clean_link)
-
-                # HEURISTIC NAME DISCOVERY: Target bolded text/headers in the founder section
-                name_selectors = ["div.font-bold", "h3"]
-                for selector in name_selectors:
-                    elements = await page.locator(selector).all()
-                    for el in elements:
-                        text = (await el.inner_text()).strip()
-                        # FILTER: Real names are usually 1-3 words. Ignore UI buttons/headers.
-                        if 0 < len(text.split()) <= 3:
-                            blacklist = ["Founders", "Jobs", "Blog", "Team", "Company", "Launch", "News"]
-                            if not any(word in text for word in blacklist):
-                                if text not in founder_names:
-                                    founder_names.append(text)
-
-                await page.close()
-                
-                # Return dictionary for easy DataFrame conversion
-                return {
-                    "Company Name": name.strip(),
-                    "Batch": batch.strip(),
-                    "Short Description": desc.strip(),
-                    "Founder Name(s)": ", ".join(founder_names),
-                    "Founder LinkedIn URL(s)": ", ".join(founder_links)
-                }
-
-            except Exception as e:
-                await page.close()
-                if attempt == 1: # On second failure, return error placeholders
-                    return {"Company Name": "Error", "URL": url}
-                await asyncio.sleep(3) # Wait before retrying
+                record = await fetch_static_profile(client, limiter, budget, url)
+            except ThrottledError:
+                record = None
+                first_attempt = 1
+            finally:
+                http_slots.release()
+            if record is not None:
+                return record
+
+            if first_attempt:
+                # Count the static fetch as the first attempt and back off before hitting the
+                # server again with a (heavier) browser request
+                await paused(budget, asyncio.sleep(backoff_delay(0)))
+            return await scrape_with_browser(page_queue, limiter, budget, url, first_attempt)
+    except TimeoutError:
+        return {"Company Name": "Error", "URL": url} # Budget exceeded: record the error and move on
+
+async def paused(budget, awaitable):
+    """
+    Awaits 'awaitable' without charging the wait to 'budget' (an asyncio.timeout() context).
+    """
+    loop = asyncio.get_running_loop()
+    remaining = budget.when() - loop.time()
+    budget.reschedule(None)
+    try:
+        return await awaitable
+    finally:
+        budget.reschedule(loop.time() + remaining)
+
+async def scrape_with_browser(page_queue, limiter, budget, url, first_attempt=0):
+    """
+    SLOW PATH: Renders the profile in a browser page, retrying with exponential backoff.
+    A page is borrowed from 'page_queue' per attempt and handed back before any backoff sleep.
+    """
+    for attempt in range(first_attempt, MAX_ATTEMPTS): # Retry logic for network stability
+        page = await paused(budget, page_queue.get()) # Waits until one of the 'CONCURRENCY_LIMIT' pages is free
+        try:
+            # RATE LIMIT: Take the token right before navigating, so navigations follow the
+            # limiter (and its current rate) rather than the moment a tab frees up
+            await paused(budget, limiter.acquire())
+            response = await page.goto(url, timeout=NAV_TIMEOUT * 1000, wait_until="domcontentloaded")
+            if response is not None and response.status in THROTTLE_STATUSES:
+                limiter.throttled()
+                raise ThrottledError(f"Throttled with HTTP {response.status}") # Triggers the retry logic
+            if response is not None and response.ok:
+                limiter.succeeded() # Only 2xx responses count towards raising the rate again
+            
+            # SMART DISCOVERY: Wait until LinkedIn links "hydrate" (render via JS) OR the
+            # founder section is present without them, so pages with no LinkedIn don't stall
+            try:
+                await page.wait_for_function(PROFILE_READY_JS, arg=PROFILE_SELECTORS, timeout=3000)
+            except PlaywrightTimeoutError:
+                pass # Continue even if no LinkedIn is found
+
+            # OPTIMIZATION: Read every field in a single round-trip to the browser
+            data = await page.evaluate(PROFILE_EXTRACT_JS, PROFILE_SELECTORS)
+            if data["name"] is None:
+                raise ValueError("Company name (h1) not found") # Triggers the retry logic
+            return build_company_record(data, url)
+
+        except asyncio.CancelledError:
+            # Wall-clock budget expired mid-attempt: stop the navigation first so the next
+            # company doesn't start on a half-loaded page
+            await reset_page(page)
+            raise
+        except Exception as e:
+            if isinstance(e, PlaywrightTimeoutError):
+                limiter.throttled() # Slow responses usually mean the host is overloaded
+            if attempt == MAX_ATTEMPTS - 1: # On final failure, return error placeholders
+                return {"Company Name": "Error", "URL": url}
+        finally:
+            page_queue.put_nowait(page) # Hand the page back before any backoff sleep
+
+        await paused(budget, asyncio.sleep(backoff_delay(attempt)))
+
+def backoff_delay(attempt):
+    """
+    EXPONENTIAL BACKOFF: 1s, 2s, 4s... (+ jitter) after the given failed attempt, capped at 60s.
+    """
+    return min(60, 2 ** attempt + random.random())
+
+async def reset_page(page):
+    """
+    Stops whatever 'page' is loading by navigating it to a blank document.
+    """
+    try:
+        await page.goto("about:blank", timeout=5000)
+    except Exception:
+        pass # The next goto() replaces the page anyway
+
+async def open_browser_context(p, user_data_dir):
+    """
+    Launches a headless Chromium context.
+    """
+    # Persistent profile: the on-disk HTTP and JS code caches let every profile after the
+    # first reuse the site's JS bundle instead of re-downloading it.
+    # NOTE: page.route()/context.route() disable the HTTP cache, so assets are blocked
+    # through CDP in block_heavy_assets() instead.
+    # Use a standard User-Agent to avoid generic bot detection
+    context = await p.chromium.launch_persistent_context(
+        user_data_dir=user_data_dir, headless=True, user_agent=USER_AGENT
+    )
+    return context
+
+async def add_pages_to_pool(context, page_queue):
+    """
+    Adds 'CONCURRENCY_LIMIT' reusable pages of one context to the shared 'page_queue',
+    reusing the blank tab that a persistent context opens at launch instead of leaving it idle.
+    """
+    pages = context.pages[:1]
+    while len(pages) < CONCURRENCY_LIMIT:
+        pages.append(await context.new_page())
+
+    for page in pages:
+        await block_heavy_assets(context, page)
+        page_queue.put_nowait(page)
+
+async def block_heavy_assets(context, page):
+    """
+    Makes 'page' skip downloading images, fonts, stylesheets and media.
+    """
+    # OPTIMIZATION: Let Chromium itself drop asset requests by URL pattern. Unlike page/context
+    # routing, no request is paused waiting for a Python decision and the HTTP cache stays enabled.
+    # Cost: the blocklist lives in this session's Network domain, which must be enabled, so
+    # Chromium also streams this page's Network.* events to it and Playwright forwards them to
+    # Python (one-way messages that nothing waits on).
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+def load_checkpoint(path):
+    """
+    Reads the rows of a previous (possibly interrupted) run from the progress CSV.
+    Failed rows are dropped so those companies get retried.
+    """
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    except FileNotFoundError:
+        return []
+    return [r for r in rows if r.get("URL") and r.get("Company Name") != "Error"]
+
+def save_progress(rows, rewrite):
+    """
+    Writes rows to the progress CSV: 'rewrite' starts a fresh file with a header,
+    otherwise the rows are appended. Returns False if the file could not be opened.
+    """
+    try:
+        with open(PROGRESS_FILE, "w" if rewrite else "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, restval="", extrasaction="ignore")
+            if rewrite:
+                writer.writeheader()
+            writer.writerows(rows)
+    except PermissionError:
+        # Occurs if the user has the CSV file open in Excel during the write
+        print("[!] Permission Denied: Close Excel to allow progress saving!")
+        return False
+    return True
 
 async def main():
     """
     Orchestrates the scraping process: Navigation -> Enrichment -> Export.
     """
     async with async_playwright() as p:
-        # Launch headless Chromium browser
-        browser = await p.chromium.launch(headless=True)
-        # Use a standard User-Agent to avoid generic bot detection
-        context = await browser.new_context(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        # Several browser contexts, each a separate Chromium process with its own renderer and
+        # cookie/storage state, so one bot flag doesn't poison every tab. All of them still talk
+        # to Python over the single Playwright driver connection.
+        # Each is a separate persistent profile (one cache directory per context): its cache is
+        # cold only for its first profile on the very first run.
+        contexts = await asyncio.gather(*[
+            open_browser_context(p, f"{BROWSER_CACHE_DIR}/context-{i}")
+            for i in range(CONTEXT_COUNT)
+        ])
+        # OPTIMIZATION: One shared pool of reusable pages from every context instead of
+        # opening/closing one per company; any idle tab takes the next company, so a slow
+        # context never leaves the others waiting
+        page_queue = asyncio.Queue()
+        await asyncio.gather(*[add_pages_to_pool(context, page_queue) for context in contexts])
         
-        # PHASE 1: Collect the 500 URLs from the directory
-        page = await context.new_page()
+        # PHASE 1: Collect the 500 URLs from the directory (borrowing a page from the pool)
+        page = await page_queue.get()
         urls = await scroll_and_extract_links(page, TARGET_COUNT)
-        await page.close()
+        page_queue.put_nowait(page)
+
+        # RESUME: Skip companies already scraped by a previous run. Rows for companies outside
+        # this run's list stay in the checkpoint file but are left out of the final export,
+        # so it never exceeds TARGET_COUNT
+        wanted = set(urls)
+        checkpoint_rows = load_checkpoint(PROGRESS_FILE)
+        results = [r for r in checkpoint_rows if r["URL"] in wanted]
+        other_rows = [r for r in checkpoint_rows if r["URL"] not in wanted]
+        done = {r["URL"] for r in results}
+        urls = [u for u in urls if u not in done]
+        if done:
+            print(f"[*] Resuming: {len(done)} companies already in {PROGRESS_FILE}.")
 
         # PHASE 2: Deep-Scrape each individual company profile
         print(f"[*] Scraping {len(urls)} profiles...")
-        semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
-        results = []
+        # OPTIMIZATION: Shared HTTP/2 client for profiles that don't need a browser
+        async with httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=10,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+        ) as client:
+            # Shared per-host rate limit for both the HTTP fast path and the browser
+            limiter = AdaptiveRateLimiter(RATE_LIMIT)
+            # Static fetches get their own slots, so they never tie up a browser tab
+            http_slots = asyncio.Semaphore(HTTP_MAX_CONNECTIONS)
 
-        # Process companies in batches to show progress and save incrementally
-        for i in range(0, len(urls), BATCH_SIZE):
-            batch_urls = urls[i:i + BATCH_SIZE]
-            print(f"[*] Processing batch {i//BATCH_SIZE + 1}...")
-            
-            # Create concurrent tasks for the current batch
-            tasks = [scrape_company_details(context, u, semaphore) for u in batch_urls]
-            batch_data = await asyncio.gather(*tasks)
-            results.extend([r for r in batch_data if r is not None])
-            
-            # INTERIM SAVE: Prevents data loss if the script crashes or internet drops
-            try:
-                pd.DataFrame(results).to_csv("yc_scraping_progress.csv", index=False)
-            except PermissionError:
-                # Occurs if the user has the CSV file open in Excel during the write
-                print("[!] Permission Denied: Close Excel to allow progress saving!")
+            # OPTIMIZATION: Append each batch to the progress CSV instead of rewriting the whole file
+            # (rewritten once at start so failed rows from a previous run are not kept)
+            progress_started = save_progress(other_rows + results, rewrite=True)
+
+            # OPTIMIZATION: Launch every profile up front; the page pool still caps concurrency,
+            # so a slow profile no longer holds back the rest of its batch
+            # The TaskGroup cancels every outstanding profile if the run is interrupted
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(scrape_company_details(page_queue, client, http_slots, limiter, u))
+                    for u in urls
+                ]
+                pending_rows = []
+
+                # Report progress and save incrementally every BATCH_SIZE completed companies
+                for done_count, task in enumerate(asyncio.as_completed(tasks), 1):
+                    record = await task
+                    if record is not None:
+                        results.append(record)
+                        pending_rows.append(record)
+
+                    if done_count % BATCH_SIZE == 0 or done_count == len(tasks):
+                        print(f"[*] Scraped {done_count}/{len(tasks)} profiles...")
+                    
+                        # INTERIM SAVE: Prevents data loss if the script crashes or internet drops.
+                        # If the file was locked, unsaved rows stay pending and are retried next time.
+                        if progress_started:
+                            saved = save_progress(pending_rows, rewrite=False)
+                        else:
+                            saved = progress_started = save_progress(other_rows + results, rewrite=True)
+                        if saved:
+                            pending_rows.clear()
 
-        await browser.close()
+        for context in contexts:
+            await context.close()
         
         # FINAL EXPORT: Save the complete dataset with a timestamped filename
-        df = pd.DataFrame(results)
+        # OPTIMIZATION: Arrow's C++ CSV writer instead of pandas' Python-level one
+        table = pa.Table.from_pylist(results, schema=CSV_SCHEMA)
         final_filename = f"yc_scraping_{datetime.now().strftime('%Y%m%d')}.csv"
-        df.to_csv(final_filename, index=False)
+        pa_csv.write_csv(table, final_filename)
         print(f"[*] Done! Final data saved to {final_filename}")
 
 if __name__ == "__main__":